@@ -10,6 +10,7 @@ import pytest
 
 from xotl.tools.objects import (
     fulldir,
+    xdir,
     smart_copy,
     lazy,
     setdefaultattr,
@@ -112,6 +113,17 @@ def test_fulldir():
     assert {"__getitem__", "get", "items", "keys"} < fulldir({})
 
 
+def test_xdir_skips_unset_slots():
+    class Slotted:
+        __slots__ = ("x", "y")
+
+    obj = Slotted()
+    obj.x = 1
+    attrs = dict(xdir(obj))
+    assert attrs["x"] == 1 and "y" not in attrs
+    assert dict(xdir(obj, filter=lambda a, v: v == 1)) == {"x": 1}
+
+
 def test_newstyle_metaclass():
     class Field:
         __slots__ = (str("name"), str("default"))
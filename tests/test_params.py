@@ -115,3 +115,25 @@ def test_pop_keyword_values():
     test = [Unset, [1, 2, 3], sum, None]
     defaults = dict(x=Unset)
     assert popkw(dict(kwds), "x", "values", *names, defaults=defaults) == test
+
+
+def test_row_key():
+    assert row("stream", 0, -1, "output").key == "stream"
+    assert row(0, 1, "indent").key == "indent"
+    assert row(0, 1).key == 0
+    assert row(0, key="first").key == "first"
+    try:
+        row()
+        assert False, "Should raise TypeError"
+    except TypeError:
+        pass
+
+
+def test_wrong_values_are_not_found():
+    from xotl.tools.fp.option import none
+    from xotl.tools.params import ParamManager
+
+    assert ParamManager((none, 5), {})(0, 1, default=1) == 5
+    assert ParamManager((none,), {})(0, default=1) == 1
+    res = scheme(row("a", 0, default=3))((none,), {}, strict=False)
+    assert res["a"] == 3
@@ -30,6 +30,17 @@ def test_slugify():
     assert slugify("_x", "_") == "_x"
 
 
+@given(text())
+@example("Manuel Vázquez")
+def test_force_ascii(s):
+    import unicodedata
+    from xotl.tools.string import force_ascii
+
+    expected = unicodedata.normalize("NFKD", s).encode("ascii", "ignore")
+    assert force_ascii(s) == expected.decode("ascii")
+    assert force_ascii(s.encode("utf-8"), encoding="utf-8") == force_ascii(s)
+
+
 # FIXME: Dont filter; `slugify` should consider this.
 valid_replacements = text().filter(lambda x: "\\" not in x)
 
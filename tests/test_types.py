@@ -255,3 +255,35 @@ class SimpleNamespaceTests(unittest.TestCase):
 class TestDynamicClassAttribute(unittest.TestCase):
     def test_isimportable(self):
         from xotl.tools.future.types import DynamicClassAttribute  # noqa
+
+
+def test_is_iterable():
+    from enum import Enum
+    from xotl.tools.future.types import is_iterable
+
+    class E(Enum):
+        A = 1
+
+    class Blocked(list):
+        __iter__ = None
+
+    class Indexed:
+        def __getitem__(self, index):
+            raise IndexError
+
+    assert is_iterable(E) is True
+    assert is_iterable(E.A) is False
+    assert is_iterable(Blocked()) is False
+    assert is_iterable(Indexed()) is True
+    assert is_iterable([]) is True
+    assert is_iterable(1) is False
+
+
+def test_is_string_like():
+    from collections import UserString
+    from xotl.tools.future.types import is_string_like
+
+    assert is_string_like("abc") is True
+    assert is_string_like(UserString("abc")) is True
+    assert is_string_like(b"abc") is False
+    assert is_string_like(1) is False
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+
+from xotl.tools.validators import (
+    is_valid_identifier,
+    validate_identifier,
+    is_valid_full_identifier,
+    is_valid_public_identifier,
+    is_valid_slug,
+)
+
+
+def test_is_valid_identifier():
+    for name in ("a", "_a", "a1", "año", "__init__"):
+        assert is_valid_identifier(name) is True, name
+    for name in ("", "1a", "a-b", "a.b", b"a", None):
+        assert is_valid_identifier(name) is False, name
+    assert is_valid_public_identifier("a") is True
+    assert is_valid_public_identifier("_a") is False
+    assert is_valid_public_identifier(None) is False
+
+
+def test_validate_identifier():
+    from sys import intern
+
+    name = "".join(["valid", "_name"])
+    assert validate_identifier(name) is intern("valid_name")
+    assert validate_identifier("1a") is None
+    assert validate_identifier(None) is None
+
+    class S(str):
+        pass
+
+    assert validate_identifier(S("valid_name")) is intern("valid_name")
+    assert validate_identifier(S("1a")) is None
+
+    class Liar(str):
+        def __str__(self):
+            return "not an-identifier"
+
+    assert validate_identifier(Liar("ok")) is intern("ok")
+
+
+def test_is_valid_full_identifier():
+    for name in ("a", "a.b", "xotl.tools._a"):
+        assert is_valid_full_identifier(name) is True, name
+    for name in ("", ".", "a.", ".a", "a..b", "a.1b", b"a.b", None):
+        assert is_valid_full_identifier(name) is False, name
+
+
+def test_is_valid_slug():
+    for slug in ("a", "a-b", "a_b-c9", "año-2020"):
+        assert is_valid_slug(slug) is True, slug
+    for slug in ("", "-a", "a-", "a--b", "a b", "a\n", b"a-b", None, 1):
+        assert is_valid_slug(slug) is False, slug
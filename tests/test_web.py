@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------
+# Copyright (c) Merchise Autrement [~º/~] and Contributors
+# All rights reserved.
+#
+# This is free software; you can do what the LICENCE file allows you to.
+#
+
+
+def test_slugify_entities():
+    from xotl.tools.web import slugify
+
+    value = "Manuel V&aacute;zquez Acosta"
+    assert slugify(value) == "manuel-vazquez-acosta"
+    assert slugify(value, entities=False) == "manuel-v-aacute-zquez-acosta"
+    value = "Manuel V&#225;zquez Acosta"
+    assert slugify(value) == "manuel-vazquez-acosta"
+    assert slugify(value, decimal=False) == "manuel-v-225-zquez-acosta"
+    value = "Manuel V&#x00e1;zquez Acosta"
+    assert slugify(value) == "manuel-vazquez-acosta"
+    assert slugify(value, hexadecimal=False) == "manuel-v-x00e1-zquez-acosta"
+    assert slugify(b"Caf\xc3\xa9") == "cafe"
+
+
+def test_slugify_unknown_entities():
+    from xotl.tools.web import slugify
+
+    assert slugify("a &nonsense; b &amp c") == "a-nonsense-b-amp-c"
+    assert slugify("&frac12; &sup2;") == "12-2"
+
+
+def test_slugify_invalid_numeric_entities():
+    from xotl.tools.web import slugify
+
+    # An out-of-range codepoint is kept as is without preventing other
+    # entities from being replaced.
+    assert slugify("a&#99999999999;b&#225;") == "a-99999999999-ba"
+
+
+def test_slugify_many():
+    from xotl.tools.web import slugify, slugify_many
+
+    values = ["Manuel V&aacute;zquez", b"Caf\xc3\xa9", "a &#225; b"]
+    assert slugify_many(values) == [slugify(value) for value in values]
+    assert slugify_many(iter(values), entities=False, decimal=False) == [
+        slugify(value, entities=False, decimal=False) for value in values
+    ]
+    assert slugify_many([]) == []
@@ -30,7 +30,9 @@ import types as _stdlib  # noqa
 from xotl.tools.deprecation import deprecated
 
 from xotl.tools.symbols import Unset as _unset
-from collections.abc import Mapping
+from xotl.tools.params import check_default as _check_default, Undefined as _undef
+from collections.abc import Iterable as _Iterable, Mapping
+from inspect import _static_getmro
 
 
 try:
@@ -112,16 +114,13 @@ def _get_mro_attr(target, name, *default):
       56
 
     """
-    from xotl.tools.future.inspect import _static_getmro
-    from xotl.tools.params import check_default, Undefined
-
     # force type
     target = target if isinstance(target, type) else type(target)
-    target_mro = _static_getmro(target)
-    cls = next((c for c in target_mro if name in c.__dict__), _unset)
-    if cls is not _unset:
-        return cls.__dict__[name]
-    elif check_default()(*default) is not Undefined:
+    for cls in _static_getmro(target):
+        attrs = cls.__dict__
+        if name in attrs:
+            return attrs[name]
+    if _check_default()(*default) is not _undef:
         return default[0]
     else:
         msg = "'{}' type has no attribute '{}'"
@@ -162,8 +161,6 @@ class mro_dict(Mapping):
     __slots__ = ("_probes", "_keys")
 
     def __init__(self, target):
-        from xotl.tools.future.inspect import _static_getmro
-
         type_ = target if isinstance(target, type) else type(target)
         target_mro = _static_getmro(type_)
         self._probes = tuple(c.__dict__ for c in target_mro)
@@ -214,8 +211,6 @@ def mro_get_full_mapping(cls, name):
     .. deprecated:: 1.8.4
 
     """
-    from xotl.tools.future.inspect import _static_getmro
-
     cls = cls if isinstance(cls, type) else type(cls)  # force type
     mro = _static_getmro(cls)
     return {t: t.__dict__[name] for t in mro if name in t.__dict__}
@@ -319,6 +314,8 @@ def is_string_like(maybe):
     .. deprecated:: 1.8.4
 
     """
+    if isinstance(maybe, str):
+        return True
     try:
         maybe + ""
     except TypeError:
@@ -334,9 +331,7 @@ def is_scalar(maybe):
     .. deprecated:: 1.8.4
 
     """
-    from collections.abc import Iterable
-
-    return isinstance(maybe, str) or not isinstance(maybe, Iterable)
+    return isinstance(maybe, str) or not isinstance(maybe, _Iterable)
 
 
 def is_staticmethod(cls, name):
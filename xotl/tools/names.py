@@ -16,6 +16,13 @@ from xotl.tools.symbols import Undefined as _undef
 # TODO: This module must be reviewed and deprecate most of it.
 
 
+# Names of the built-in singletons, indexed by identity (these objects live as
+# long as the interpreter, so their `id` is stable).
+_SINGLETON_NAMES = {
+    id(s): str(s) for s in (None, True, False, Ellipsis, NotImplemented)
+}
+
+
 def _get_mappings(source):
     """Return a sequence of mappings from `source`.
 
@@ -239,8 +246,7 @@ def simple_name(item, join=True):
     # TODO: deprecate `join` argument
     from xotl.tools.future.inspect import safe_name
 
-    singletons = (None, True, False, Ellipsis, NotImplemented)
-    res = next((str(s) for s in singletons if s is item), None)
+    res = _SINGLETON_NAMES.get(id(item))
     if res is None:
         res = safe_name(item)
         if res is None:
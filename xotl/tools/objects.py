@@ -10,7 +10,9 @@
 """Several utilities for objects in general."""
 
 import sys
+from collections.abc import Mapping
 from contextlib import contextmanager
+from types import MappingProxyType
 
 from xotl.tools.symbols import Unset
 from xotl.tools.deprecation import deprecated
@@ -343,9 +345,9 @@ def smart_getter(obj, strict=False):
     .. versionchanged:: 1.5.3 Added the parameter `strict`.
 
     """
-    from xotl.tools.future.collections import Mapping
-
-    if isinstance(obj, Mapping):
+    # Check the most common mapping types before the (slower) ABC test
+    tp = type(obj)
+    if tp is dict or tp is MappingProxyType or isinstance(obj, Mapping):
         if not strict:
             return obj.get
         else:
@@ -411,7 +413,7 @@ def smart_getter_and_deleter(obj):
     `collections.MutableMapping`.
 
     """
-    from collections.abc import Mapping, MutableMapping
+    from collections.abc import MutableMapping
     from functools import partial
 
     if isinstance(obj, Mapping) and not isinstance(obj, MutableMapping):
@@ -671,16 +673,28 @@ def xdir(obj, getter=None, filter=None, _depth=0):
                    ``getattr`` to be used to get the values from `obj`.  If
                    None, use `getattr`:func:.
 
+    Attributes listed by `dir`:func: but that can't be retrieved (the
+    `getter` raises `AttributeError`:class:, for example an unset slot) are
+    skipped.
+
     .. versionchanged:: 1.8.1 Removed deprecated `attr_filter` and
        `value_filter` arguments.
 
     """
-    getter = getter or getattr
+    get = getter or getattr
+    accept = filter or _true
     attrs = dir(obj)
-    res = ((a, getter(obj, a)) for a in attrs)
-    if filter:
-        res = ((a, v) for a, v in res if filter(a, v))
-    return res
+
+    def _iter():
+        for a in attrs:
+            try:
+                v = get(obj, a)
+            except AttributeError:
+                continue
+            if accept(a, v):
+                yield a, v
+
+    return _iter()
 
 
 def fdir(obj, getter=None, filter=None):
@@ -800,11 +814,10 @@ def get_first_of(source, *keys, default=None, pred=None):
     .. versionchanged:: 1.5.2  Added the `pred` option.
 
     """
-    _key, res = next(
-        ((k, val) for k, val in iterate_over(source, *keys) if not pred or pred(val)),
-        (Unset, Unset),
-    )
-    return res if res is not Unset else default
+    for _key, val in iterate_over(source, *keys):
+        if not pred or pred(val):
+            return val
+    return default
 
 
 def pop_first_of(source, *keys, default=None):
@@ -880,17 +893,16 @@ def popattr(obj, name, default=None):
         True
 
     """
-    res = getattr(obj, name, Unset)
-    if res is Unset:
-        res = default
-    else:
-        try:
-            delattr(obj, name)
-        except AttributeError:
-            try:
-                delattr(obj.__class__, name)
-            except AttributeError:
-                pass
+    try:
+        res = getattr(obj, name)
+    except AttributeError:
+        return default
+    try:
+        delattr(obj, name)
+    except AttributeError:
+        cls = obj.__class__
+        if name in cls.__dict__:
+            delattr(cls, name)
     return res
 
 
@@ -1529,20 +1541,19 @@ def get_traverser(*paths, default=Unset, sep=".", getter=None):
         if not getter:
             getter = lambda o, a, default=None: smart_getter(o)(a, default)
 
+        attrs = path.split(sep)
+
         def inner(obj):
             found = object()
             current = obj
-            attrs = path.split(sep)
-            while current is not found and attrs:
-                attr = attrs.pop(0)
+            for attr in attrs:
                 current = getter(current, attr, found)
-            if current is found:
-                if default is Unset:
-                    raise AttributeError(attr)
-                else:
-                    return default
-            else:
-                return current
+                if current is found:
+                    if default is Unset:
+                        raise AttributeError(attr)
+                    else:
+                        return default
+            return current
 
         return inner
 
@@ -1552,7 +1563,7 @@ def get_traverser(*paths, default=Unset, sep=".", getter=None):
         _traversers = tuple(_traverser(path, default=default) for path in paths)
 
         def _result(obj):
-            return tuple(traverse(obj) for traverse in _traversers)
+            return tuple([traverse(obj) for traverse in _traversers])
 
         result = _result
     return result
@@ -28,6 +28,11 @@ means several possibilities.
 MAX_ARG_COUNT = 1024 * 1024  # just any large number
 
 from xotl.tools.symbols import Undefined  # used implicitly for absent default
+from xotl.tools.fp.option import Just, Wrong, none
+
+
+# Marks a parameter value as not found yet, see `ParamManager`:class:.
+_MISSING = object()
 
 
 def issue_9137(args):
@@ -149,7 +154,7 @@ def single(args, kwds):
     .. versionadded:: 1.8.0
 
     """
-    from xotl.tools.fp.option import Just, Wrong, take
+    from xotl.tools.fp.option import take
 
     if len(args) == 1 and not kwds:
         res = take(args[0])
@@ -245,6 +250,16 @@ def pop_keyword_values(kwargs, *names, **options):
     return res
 
 
+def _classify_ids(ids):
+    """Tag each identifier telling if it is positional (an integer) or not.
+
+    Return a tuple of ``(positional, key)`` pairs, so type checks are done
+    only once per scheme-row instead of in every `ParamManager`:class: call.
+
+    """
+    return tuple((isinstance(key, int), key) for key in ids)
+
+
 class ParamManager:
     """Function parameters parser.
 
@@ -273,54 +288,74 @@ class ParamManager:
         self.args = args
         self.kwds = kwds
         self.consumed = set()  # consumed identifiers
+        self._nargs = len(args)
 
     def __call__(self, *ids, **options):
         """Get a parameter value."""
-        from xotl.tools.fp.option import Just, Wrong, none
-
         # TODO: Change this ``from xotl.tools.values import coercer``
         from xotl.tools.fp.prove.semantic import predicate as coercer
 
-        args, kwds = self.args, self.kwds
-        i, res = 0, none
-        while isinstance(res, Wrong) and i < len(ids):
-            key = ids[i]
-            if key in self.consumed:
-                pass
-            elif isinstance(key, int):
-                try:
-                    res = args[key]
-                except IndexError:
-                    pass
-            elif key in kwds:
-                res = kwds[key]
-            if not isinstance(res, Wrong) and "coerce" in options:
-                aux = coercer(options["coerce"])(res)
-                res = aux.inner if isinstance(aux, Just) else aux
-            if not isinstance(res, Wrong):
-                self.consumed.add(key)
-                if isinstance(key, int) and key < 0:
-                    # consume both, negative and adjusted value
-                    key = len(args) + key
-                    self.consumed.add(key)
+        check = coercer(options["coerce"]) if "coerce" in options else None
+        has_default = "default" in options
+        default = options.get("default")
+        return self._get(_classify_ids(ids), check, has_default, default)
+
+    def _get(self, typed_ids, check, has_default, default):
+        """Get a parameter value from pre-processed options.
+
+        :param typed_ids: the result of ``_classify_ids(ids)``.
+
+        :param check: an already built coercer, or None.
+
+        """
+        args, kwds, consumed = self.args, self.kwds, self.consumed
+        nargs = self._nargs
+        res, failure = _MISSING, none
+        for positional, key in typed_ids:
+            if key in consumed:
+                continue
+            if positional:
+                if -nargs <= key < nargs:
+                    value = args[key]
+                else:
+                    continue
             else:
-                i += 1
-        if isinstance(res, Wrong):
-            if "default" in options:
-                return options["default"]
-            elif isinstance(res.inner, BaseException):
-                raise res.inner
+                value = kwds.get(key, _MISSING)
+                if value is _MISSING:
+                    continue
+            if isinstance(value, Wrong):
+                # a `Wrong` value counts as not given
+                failure = value
+                continue
+            if check is not None:
+                aux = check(value)
+                if isinstance(aux, Wrong):
+                    failure = aux
+                    continue
+                value = aux.inner if isinstance(aux, Just) else aux
+            res = value
+            consumed.add(key)
+            if positional and key < 0:
+                # consume both, negative and adjusted value
+                consumed.add(nargs + key)
+            break
+        if res is _MISSING:
+            if has_default:
+                return default
+            elif isinstance(failure.inner, BaseException):
+                raise failure.inner
             else:
+                ids = tuple(key for _positional, key in typed_ids)
                 raise TypeError('value for "{}" is not found'.format(ids))
         else:
             return res.inner if isinstance(res, Just) else res
 
     def remainder(self):
         """Return not consumed values in a mapping."""
-        passed = set(range(len(self.args))) | set(self.kwds)
-        ids = passed - self.consumed
-        args, kwds = self.args, self.kwds
-        return {k: args[k] if isinstance(k, int) else kwds[k] for k in ids}
+        args, kwds, consumed = self.args, self.kwds, self.consumed
+        res = {k: args[k] for k in range(self._nargs) if k not in consumed}
+        res.update((k, v) for k, v in kwds.items() if k not in consumed)
+        return res
 
 
 class ParamSchemeRow:
@@ -353,11 +388,10 @@ class ParamSchemeRow:
 
     """
 
-    __slots__ = ("ids", "options", "_key")
+    __slots__ = ("ids", "key", "_typed_ids", "_coerce", "_default", "_has_default")
 
     def __init__(self, *ids, **options):
         from collections import Counter
-        from xotl.tools.fp.option import none
 
         iskey = lambda s: isinstance(s, str) and s.isidentifier()
         # TODO: Change this ``from xotl.tools.values import coercer``
@@ -383,18 +417,33 @@ class ParamSchemeRow:
         if not (key is none or iskey(key)):
             msg = '"key" option must be an identifier, "{}" of type "{}" ' "given"
             raise TypeError(msg.format(key, type(key).__name__))
-        if "default" in options:
-            aux = {"default": options.pop("default")}
-        else:
-            aux = {}
+        self._has_default = "default" in options
+        self._default = options.pop("default", None)
         if "coerce" in options:
-            aux["coerce"] = coercer(options.pop("coerce"))
+            self._coerce = coercer(options.pop("coerce"))
+        else:
+            self._coerce = None
         if options:
             msg = "{}(): received invalid keyword parameters: {}"
             raise TypeError(msg.format(type(self).__name__, set(options)))
+        if key is none:
+            key = next((k for k in ids if isinstance(k, str)), None)
+            if key is None:
+                if ids:
+                    key = ids[0]
+                else:
+                    msg = '{}() requires at least one identifier or a "key"'
+                    raise TypeError(msg.format(type(self).__name__))
         self.ids = ids
-        self.options = aux
-        self._key = key
+        self._typed_ids = _classify_ids(ids)
+        #: The primary key for this scheme-row definition.
+        #:
+        #: This concept is a little tricky (the first string identifier if
+        #: some is given, if not then the first integer).  This definition is
+        #: useful, for example, to return remainder not consumed values after
+        #: a scheme process is completed (see `ParamManager.remainder`:meth:
+        #: for more information).
+        self.key = key
 
     def __str__(self):
         parts = [repr(k) for k in self.ids]
@@ -425,7 +474,19 @@ class ParamSchemeRow:
                 if isinstance(a, tuple) and isinstance(k, dict):
                     args, kwds = a, k
             manager = ParamManager(args, kwds)
-        return manager(*self.ids, **self.options)
+        return manager._get(
+            self._typed_ids, self._coerce, self._has_default, self._default
+        )
+
+    @property
+    def options(self):
+        """A mapping with the defined ``default`` and ``coerce`` options."""
+        res = {}
+        if self._has_default:
+            res["default"] = self._default
+        if self._coerce is not None:
+            res["coerce"] = self._coerce
+        return res
 
     @property
     def default(self):
@@ -434,31 +495,7 @@ class ParamSchemeRow:
         If not defined, special value ``none`` is returned.
 
         """
-        from xotl.tools.fp.option import none
-
-        return self.options.get("default", none)
-
-    @property
-    def key(self):
-        """The primary key for this scheme-row definition.
-
-        This concept is a little tricky (the first string identifier if some
-        is given, if not then the first integer).  This definition is useful,
-        for example, to return remainder not consumed values after a scheme
-        process is completed (see `ParamManager.remainder`:meth: for more
-        information).
-
-        """
-        # TODO: calculate the key value in the constructor
-        from xotl.tools.fp.option import none
-
-        res = self._key
-        if res is none:
-            res = next((k for k in self.ids if isinstance(k, str)), None)
-            if res is None:
-                res = self.ids[0]
-            self._key = res
-        return res
+        return self._default if self._has_default else none
 
 
 class ParamScheme:
@@ -471,7 +508,7 @@ class ParamScheme:
 
     """
 
-    __slots__ = ("rows", "cache")
+    __slots__ = ("rows", "cache", "_plan")
 
     def __init__(self, *rows):
         from xotl.tools.params import check_count
@@ -491,6 +528,16 @@ class ParamScheme:
                     raise ValueError(msg)
         self.rows = rows
         self.cache = None
+        # The key and the `ParamManager._get`:meth: arguments for each row,
+        # avoids the dispatch done in `ParamSchemeRow.__call__`:meth: when
+        # processing a full scheme.
+        self._plan = tuple(
+            (
+                row.key,
+                (row._typed_ids, row._coerce, row._has_default, row._default),
+            )
+            for row in rows
+        )
 
     def __str__(self):
         # XXX: Use:: ',\n\i'.join(map(str, self))
@@ -524,15 +571,12 @@ class ParamScheme:
         value is missing.
 
         """
-
-        def ok(v):
-            from xotl.tools.fp.option import Wrong
-
-            return not isinstance(v, Wrong)
-
         pm = ParamManager(args, kwds)
-        aux = ((row.key, row(pm)) for row in self)
-        res = {key: value for key, value in aux if ok(value)}
+        res = {}
+        for key, row_args in self._plan:
+            value = pm._get(*row_args)
+            if not isinstance(value, Wrong):
+                res[key] = value
         rem = pm.remainder()
         if strict:
             if rem:
@@ -556,14 +600,8 @@ class ParamScheme:
     @property
     def defaults(self):
         """Return a mapping with all valid default values."""
-
-        def ok(v):
-            from xotl.tools.fp.option import Wrong
-
-            return not isinstance(v, Wrong)
-
         aux = ((row.key, row.default) for row in self)
-        return {k: d for k, d in aux if ok(d)}
+        return {k: d for k, d in aux if not isinstance(d, Wrong)}
 
     def _getcache(self):
         if not self.cache:
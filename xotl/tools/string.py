@@ -12,10 +12,14 @@ In Python 3 `str` is always unicode but `unicode` and `basestring` types
 doesn't exists.  `bytes` type can be used as an array of one byte each item.
 
 """
+import re
+import unicodedata
 from typing import Any, Optional, Pattern
 
 from xotl.tools.deprecation import deprecated  # noqa
 from xotl.tools.deprecation import import_deprecated  # noqa
+from xotl.tools.future.codecs import safe_decode as _safe_decode
+from xotl.tools.future.codecs import safe_encode as _safe_encode
 
 
 _MIGRATED_TO_CODECS = ("force_encoding", "safe_decode", "safe_encode")
@@ -45,12 +49,10 @@ except AttributeError:
         In Python 3.9+ this is the same as `str.removeprefix`:func:.
 
         """
-        from xotl.tools.future.codecs import safe_encode, safe_decode
-
         if isinstance(self, str) and isinstance(prefix, bytes):
-            prefix = safe_decode(prefix)
+            prefix = _safe_decode(prefix)
         elif isinstance(self, bytes) and isinstance(prefix, str):
-            prefix = safe_encode(prefix)
+            prefix = _safe_encode(prefix)
         return self[len(prefix) :] if self.startswith(prefix) else self
 
 
@@ -83,12 +85,10 @@ except AttributeError:
         In Python 3.9+ this is the same as `str.removesuffix`:func:.
 
         """
-        from xotl.tools.future.codecs import safe_decode, safe_encode
-
         if isinstance(self, str) and isinstance(suffix, bytes):
-            suffix = safe_decode(suffix)
+            suffix = _safe_decode(suffix)
         elif isinstance(self, bytes) and isinstance(suffix, str):
-            suffix = safe_encode(suffix)
+            suffix = _safe_encode(suffix)
         # Since value.endswith('') is always true but value[:-0] is actually
         # always value[:0], which is always '', we have to explictly test for
         # len(suffix)
@@ -131,14 +131,24 @@ def force_ascii(value: Any, encoding: str = None) -> str:
     .. versionchanged:: 2.1.0 Moved to `xotl.tools.string`:mod:.
 
     """
-    import unicodedata
-    from .future.codecs import safe_decode
+    return str(_ascii_bytes(value, encoding), "ascii")
+
+
+def _ascii_bytes(value, encoding=None):
+    """Return the ASCII bytes of the normal form of `value`.
 
+    This is the core of `force_ascii`:func:, useful to apply other
+    transformations before decoding the result only once.
+
+    """
     ASCII, IGNORE = "ascii", "ignore"
     if not isinstance(value, str):
-        value = safe_decode(value, encoding=encoding)
-    res = unicodedata.normalize("NFKD", value).encode(ASCII, IGNORE)
-    return str(res, ASCII, IGNORE)
+        value = _safe_decode(value, encoding=encoding)
+    try:
+        # ASCII strings are already in normal form
+        return value.encode(ASCII)
+    except UnicodeEncodeError:
+        return unicodedata.normalize("NFKD", value).encode(ASCII, IGNORE)
 
 
 def slugify(value: Any, *args, **kwds) -> str:
@@ -240,8 +250,6 @@ def slugify(value: Any, *args, **kwds) -> str:
        `valids`.
 
     """
-    import re
-
     from .params import ParamManager
     from .values import compose, istype
     from .values.simple import not_false, ascii_coerce
@@ -251,7 +259,7 @@ def slugify(value: Any, *args, **kwds) -> str:
 
     # local functions
     def _normalize(v):
-        return force_ascii(v, encoding=encoding).lower()
+        return str(_ascii_bytes(v, encoding=encoding).lower(), "ascii")
 
     def _set(v):
         return re.escape("".join(set(_normalize(v))))
@@ -306,12 +314,9 @@ def slugify(value: Any, *args, **kwds) -> str:
     if invalid_regex:
         res = invalid_regex.sub(repl, res)
     if repl:
-        # convert two or more replacements in only one instance
-        r = r"{}".format(re.escape(repl))
-        res = re.sub(r"({r}){{2,}}".format(r=r), repl, res)
-        # remove start and end more replacement instances
-        res = re.sub(r"(^{r}+|{r}+$)".format(r=r), "", res)
-        res = re.sub(r"[\t]", replacement, res)
+        # convert runs of replacements in only one instance, removing those at
+        # the start and the end
+        res = replacement.join(filter(None, res.split(repl)))
     return res
 
 
@@ -14,12 +14,20 @@ All values only could be `True` or `False` but are intended in places where
 
 """
 
+from sys import intern as _intern
+
 
 SYMBOL = "symbol"
 BOOLEAN = "boolean"
 
 TIMEOUT = 2.0
 
+# Initial registries of `symbol`:class: instances: standard Boolean values are
+# always valid.  Since symbols are never released, `id` is safe as a key for
+# the reverse mapping.
+_BOOT_INSTANCES = {"False": False, "True": True}
+_BOOT_NAMES = {id(False): "False", id(True): "True"}
+
 
 class MetaSymbol(type):
     """Meta-class for symbol types."""
@@ -28,7 +36,8 @@ class MetaSymbol(type):
         if ns["__module__"] == __name__ or name not in {SYMBOL, BOOLEAN}:
             self = super().__new__(cls, name, bases, ns)
             if name == SYMBOL:
-                self._instances = {str(v): v for v in (False, True)}
+                self._instances = dict(_BOOT_INSTANCES)
+                self._names = dict(_BOOT_NAMES)
             return self
         else:
             raise TypeError(
@@ -38,6 +47,8 @@ class MetaSymbol(type):
 
     def __instancecheck__(self, instance):
         """Override for isinstance(instance, self)."""
+        # Exact instances of `self` never get here: `isinstance` checks that
+        # before calling this method.
         if instance is False or instance is True:
             return True
         else:
@@ -45,15 +56,15 @@ class MetaSymbol(type):
 
     def __subclasscheck__(self, subclass):
         """Override for issubclass(subclass, self)."""
-        if subclass is bool:
+        if subclass is bool or subclass is self:
             return True
         else:
-            return super().__subclasscheck__(subclass)
+            # Cheaper than building a `super` proxy
+            return type.__subclasscheck__(self, subclass)
 
     def nameof(self, s):
         """Get the name of a symbol instance (`s`)."""
-        items = self._instances.items()
-        return next((name for name, value in items if value is s), None)
+        return self._names.get(id(s))
 
     def parse(self, name):
         """Returns instance from a string.
@@ -61,8 +72,7 @@ class MetaSymbol(type):
         Standard Python Boolean values are parsed too.
 
         """
-        if "#" in name:  # Remove comment
-            name = name.split("#")[0].strip()
+        name = name.partition("#")[0].strip()  # Remove comment
         res = self._instances.get(name, None)
         if res is not None:
             if isinstance(res, self):
@@ -107,33 +117,31 @@ class symbol(int, metaclass=MetaSymbol):
                name hash.
 
         """
-        from sys import intern as unique
-
-        name = unique(name)
-        if name:
+        res = cls._instances.get(name)
+        if res is None:  # Create the new instance
+            name = _intern(name)
+            if not name:
+                raise ValueError("name must be a valid non empty string")
+            if value is None:
+                value = hash(name)
+            if isinstance(value, int):
+                res = super().__new__(cls, value)
+                cls._instances[name] = res
+                cls._names[id(res)] = name
+            else:
+                msg = (
+                    'instancing "{}" with name "{}" and incorrect '
+                    'value "{}" of type "{}"'
+                )
+                cn, vt = cls.__name__, type(value).__name__
+                raise TypeError(msg.format(cn, name, value, vt))
+        else:  # Check existing instance
             if value is None:
                 value = hash(name)
-            res = cls._instances.get(name)
-            if res is None:  # Create the new instance
-                if isinstance(value, int):
-                    res = super().__new__(cls, value)
-                    cls._instances[name] = res
-                else:
-                    msg = (
-                        'instancing "{}" with name "{}" and incorrect '
-                        'value "{}" of type "{}"'
-                    )
-                    cn, vt = cls.__name__, type(value).__name__
-                    raise TypeError(msg.format(cn, name, value, vt))
-            elif res != value:  # Check existing instance
+            if res != value:
                 msg = 'value "{}" mismatch for existing instance: "{}"'
                 raise ValueError(msg.format(value, name))
-            return res
-        else:
-            raise ValueError("name must be a valid non empty string")
-
-    def __init__(self, *args, **kwds):
-        pass
+        return res
 
     def __repr__(self):
         return symbol.nameof(self)
@@ -189,9 +197,7 @@ class boolean(symbol):
         return super().__new__(cls, name, bool(value))
 
     def __getnewargs__(self):
-        cls = type(self)
-        name = next((key for key, obj in cls._instances.items() if obj is self))
-        return (name, bool(self))
+        return (symbol.nameof(self), bool(self))
 
 
 # --- Special singleton values ---
@@ -16,6 +16,7 @@ functions for several identifiers.
 # TODO: Check next import, it looks like one of the modules must be deprecated
 from xotl.tools.validators.identifiers import (  # noqa
     is_valid_identifier,
+    validate_identifier,
     check_identifier,
     is_valid_full_identifier,
     is_valid_public_identifier,
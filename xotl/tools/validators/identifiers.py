@@ -11,11 +11,15 @@
 Regular expressions and validation functions for several identifiers.
 """
 
-from re import compile as _regex_compile
+from re import compile as _regex_compile, ASCII as _ASCII
+from sys import intern as _intern
+
+from xotl.tools.future.functools import lru_cache as _lru_cache
 
 
 __all__ = (
     "is_valid_identifier",
+    "validate_identifier",
     "is_valid_full_identifier",
     "is_valid_public_identifier",
     "is_valid_slug",
@@ -45,16 +49,36 @@ def check_identifier(name):
         raise ValueError('"%s" is not a valid identifier!' % name)
 
 
+def validate_identifier(name):
+    """Return `name` interned if it is a valid Python identifier, else None.
+
+    Useful when validated names are used later as keys of dictionaries
+    (attribute tables, registries, etc.), since look-ups with interned strings
+    compare by identity.
+
+    .. versionadded:: 2.2.0
+
+    """
+    # `sys.intern`:func: only accepts exact strings; `str.__str__` copies the
+    # validated content even if a subclass overrides `__str__`.
+    return _intern(str.__str__(name)) if is_valid_identifier(name) else None
+
+
 def is_valid_full_identifier(name):
     """Returns True if `name` is a valid dotted Python identifier.
 
     See `is_valid_identifier`:func: for what "validity" means.
 
     """
-    if isinstance(name, str):
-        return all(part.isidentifier() for part in name.split("."))
-    else:
-        return False
+    return isinstance(name, str) and _is_valid_str_full_identifier(name)
+
+
+# Validation results of dotted names and slugs are cached since the same
+# values are checked repeatedly; this is not done for simple identifiers
+# because `str.isidentifier`:meth: is as fast as a cache look-up.
+@_lru_cache(maxsize=4096)
+def _is_valid_str_full_identifier(name):
+    return all(part.isidentifier() for part in name.split("."))
 
 
 def is_valid_public_identifier(name):
@@ -69,8 +93,19 @@ def is_valid_public_identifier(name):
     return is_valid_identifier(name) and not name.startswith("_")
 
 
-_SLUG_REGEX = _regex_compile(r"(?i)^[\w]+([-][\w]+)*$")
+_SLUG_REGEX = _regex_compile(r"\w+(?:-\w+)*")
+_slug_fullmatch = _SLUG_REGEX.fullmatch
+
+# Most slugs are ASCII, matching ``\w`` against the ASCII class is faster
+# than against the full Unicode one.  A slug valid under the former is also
+# valid under the latter.
+_ascii_slug_fullmatch = _regex_compile(_SLUG_REGEX.pattern, _ASCII).fullmatch
+
+
+@_lru_cache(maxsize=4096)
+def _is_valid_str_slug(slug):
+    return _ascii_slug_fullmatch(slug) is not None or _slug_fullmatch(slug) is not None
 
 
 def is_valid_slug(slug):
-    return isinstance(slug, str) and _SLUG_REGEX.match(slug)
+    return isinstance(slug, str) and _is_valid_str_slug(slug)
@@ -204,7 +204,7 @@ def coercer_name(arg, join=None):
             res = arg.__name__
         except Exception:
             res = str(arg)
-        suffix = str("_coerce")
+        suffix = "_coerce"
         if res.endswith(suffix):
             res = res[: -len(suffix)]
         return res
@@ -349,7 +349,7 @@ def create_int_range_coerce(min, max):
             else:
                 return nil
 
-        inner.__name__ = str("int_between_{}_and_{}_coerce".format(min, max))
+        inner.__name__ = "int_between_{}_and_{}_coerce".format(min, max)
         inner.__doc__ = inner.__doc__.format(min, max)
         return inner
     else:
@@ -442,7 +442,7 @@ def create_unique_member_coerce(coerce, container):
         return res
 
     cname = coercer_name(coerce)
-    inner.__name__ = str("unique_member_{}_coerce".format(cname))
+    inner.__name__ = "unique_member_{}_coerce".format(cname)
     inner.__doc__ = inner.__doc__.format(cname)
     return inner
 
@@ -511,12 +511,12 @@ class custom:
     def __str__(self):
         name = coercer_name(self.inner, join=self._str_join)
         cls_name = type(self).__name__
-        return str("{}_{}_coerce".format(name, cls_name))
+        return "{}_{}_coerce".format(name, cls_name)
 
     def __repr__(self):
         name = coercer_name(self.inner, join=self._repr_join)
         cls_name = type(self).__name__
-        return str("{}({})".format(cls_name, name))
+        return "{}({})".format(cls_name, name)
 
     def __call__(self, arg):
         return nil
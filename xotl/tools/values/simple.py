@@ -17,9 +17,17 @@ chars, are buffers.
 
 """
 
+from collections import deque
+from types import GeneratorType
+
 from xotl.tools.values import coercer, nil
 
 
+# Common collection types, used to avoid the (slow) ABC checks for exact
+# instances of them in `collection`:func: coercers.
+_COLLECTION_TYPES = (tuple, list, set, frozenset, range, deque, GeneratorType)
+
+
 @coercer
 def not_false_coercer(arg):
     """Validate that `arg` is not a false value.
@@ -72,8 +80,6 @@ def name_coerce(arg):
     ignored and considered invalid.
 
     """
-    from types import GeneratorType
-
     if isinstance(arg, GeneratorType):
         return nil
     else:
@@ -129,28 +135,36 @@ def collection(arg=nil, avoid=(), force=False, base=None, name=None):
         from collections.abc import Iterable as base
     if not isinstance(avoid, tuple):
         avoid = (avoid,)
+    invalid = (str,) + avoid
+    if arg is not nil:
+        # direct check, there is no reusable coercer to prepare
+        assert not name
+        ok = not isinstance(arg, invalid) and isinstance(arg, base)
+        return arg if ok else ([arg] if force else nil)
+    fast = frozenset(
+        t
+        for t in _COLLECTION_TYPES
+        if issubclass(t, base) and not issubclass(t, invalid)
+    )
 
     @coercer
     def collection_coerce(arg):
-        invalid = (str,) + avoid
-        ok = not isinstance(arg, invalid) and isinstance(arg, base)
+        if type(arg) in fast:
+            ok = True
+        else:
+            ok = not isinstance(arg, invalid) and isinstance(arg, base)
         return arg if ok else ([arg] if force else nil)
 
-    if arg is nil:
-        doc = (
-            "Return the same argument if it is a strict iterable.\n    "
-            "Strings{} are not considered valid iterables in this case.\n"
-        ).format(" and {}".format(avoid) if avoid else "")
-        if force:
-            doc += "    A non iterable argument is wrapped in a list.\n"
-        collection_coerce.__doc__ = doc
-        del doc
-        if name:
-            collection_coerce.__name__ = name
-        return collection_coerce
-    else:
-        assert not name
-        return collection_coerce(arg)
+    doc = (
+        "Return the same argument if it is a strict iterable.\n    "
+        "Strings{} are not considered valid iterables in this case.\n"
+    ).format(" and {}".format(avoid) if avoid else "")
+    if force:
+        doc += "    A non iterable argument is wrapped in a list.\n"
+    collection_coerce.__doc__ = doc
+    if name:
+        collection_coerce.__name__ = name
+    return collection_coerce
 
 
 from collections.abc import Mapping, Sequence  # noqa
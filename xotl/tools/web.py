@@ -9,7 +9,49 @@
 
 """Utils for Web applications."""
 
-__all__ = ["slugify"]
+import re
+from html.entities import name2codepoint
+
+from xotl.tools.future.codecs import safe_decode
+from xotl.tools.future.functools import lru_cache
+from xotl.tools.string import slugify as _slugify
+
+__all__ = ["slugify", "slugify_many"]
+
+
+# A single pass over the string handles the three kinds of entities; named
+# entities are matched by shape and resolved with a dict lookup instead of
+# an alternation of every known entity name.
+_ENTITIES_REGEX = re.compile(r"&(?:#(\d+)|#x([\da-fA-F]+)|([a-zA-Z][a-zA-Z0-9]*));")
+
+
+@lru_cache(maxsize=8)
+def _entities_replacer(entities, decimal, hexadecimal):
+    """Return the `re.sub` callback for the enabled kinds of entities.
+
+    There is one callback for each combination of the flags.
+
+    """
+
+    def replace(match):
+        dec, hexa, name = match.groups()
+        try:
+            if dec is not None:
+                if decimal:
+                    return chr(int(dec))
+            elif hexa is not None:
+                if hexadecimal:
+                    return chr(int(hexa, 16))
+            elif entities:
+                codepoint = name2codepoint.get(name)
+                if codepoint is not None:
+                    return chr(codepoint)
+        except (ValueError, OverflowError):
+            # `chr` rejects codepoints out of range
+            pass
+        return match.group(0)
+
+    return replace
 
 
 # TODO: Why not deprecate this and use standard `xotl.tools.string.slugify`.
@@ -63,35 +105,39 @@ def slugify(
         >>> slugify('Manuel V&#x00e1;zquez Acosta', hexadecimal=False)  # doctest: +SKIP  # noqa
         'manuel-v-x00e1-zquez-acosta'
 
+    Results are cached for the 8192 most recently used combinations of
+    arguments.
+
     .. deprecated:: 2.1.0 Use `xotl.tools.strings.slugify`:func:.
 
-    """
-    import re
-    from xotl.tools.string import slugify
-    from xotl.tools.future.codecs import safe_decode
+    .. versionchanged:: 2.2.0 Cache results.
 
+    """
     if not isinstance(s, str):
         s = safe_decode(s)
-    if entities:
-        try:
-            from htmlentitydefs import name2codepoint
-        except ImportError:
-            # Py3k: The ``htmlentitydefs`` module has been renamed to
-            # ``html.entities`` in Python 3
-            from html.entities import name2codepoint
-        s = re.sub(
-            str("&(%s);") % str("|").join(name2codepoint),
-            lambda m: chr(name2codepoint[m.group(1)]),
-            s,
-        )
-    if decimal:
-        try:
-            s = re.sub(r"&#(\d+);", lambda m: chr(int(m.group(1))), s)
-        except Exception:  # TODO: @med which exceptions are expected?
-            pass
-    if hexadecimal:
-        try:
-            s = re.sub(r"&#x([\da-fA-F]+);", lambda m: chr(int(m.group(1), 16)), s)
-        except Exception:  # TODO: @med which exceptions are expected?
-            pass
-    return slugify(s, "-")
+    return _cached_slugify(s, bool(entities), bool(decimal), bool(hexadecimal))
+
+
+def slugify_many(values, entities=True, decimal=True, hexadecimal=True):
+    """Return the list of slugs for each item in `values`.
+
+    Equivalent to ``[slugify(value, entities, decimal, hexadecimal) for value
+    in values]`` but the options are processed only once.
+
+    .. versionadded:: 2.2.0
+
+    """
+    flags = bool(entities), bool(decimal), bool(hexadecimal)
+    cached = _cached_slugify
+    return [
+        cached(value if isinstance(value, str) else safe_decode(value), *flags)
+        for value in values
+    ]
+
+
+@lru_cache(maxsize=8192)
+def _cached_slugify(s, entities, decimal, hexadecimal):
+    if (entities or decimal or hexadecimal) and "&" in s:
+        replace = _entities_replacer(entities, decimal, hexadecimal)
+        s = _ENTITIES_REGEX.sub(replace, s)
+    return _slugify(s, "-")